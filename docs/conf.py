@@ -42,19 +42,10 @@ author = "Penny Madysa"
 release = dist.version
 version = release.partition("+")[0]
 
-assert dist.metadata is not None
-for entry in dist.metadata.get_all("Project-URL", []):
-    url: str
-    kind, url = entry.split(", ")
-    if kind == "gitlab":
-        gitlab_url = url.removesuffix("/")
-        license_url = f"{gitlab_url}/-/blob/master/COPYING"
-        issues_url = f"{gitlab_url}/-/issues"
-        break
-else:
-    gitlab_url = ""
-    license_url = ""
-    issues_url = ""
+# Keep these in sync with `[project.urls]` in `pyproject.toml`.
+gitlab_url = "https://gitlab.cern.ch/geoff/cernml-coi"
+license_url = f"{gitlab_url}/-/blob/master/COPYING"
+issues_url = f"{gitlab_url}/-/work_items"
 
 # -- General configuration ---------------------------------------------
 
@@ -173,6 +164,10 @@ intersphinx_mapping = {
     "utils": (acc_py_docs_link("geoff/cernml-coi-utils"), None),
 }
 
+# Don't let an unreachable inventory server stall the build
+# indefinitely. Its references are reported as missing instead.
+intersphinx_timeout = 10
+
 
 # -- Options for custom extension FixSig -------------------------------
 
@@ -48,8 +48,8 @@ class Quadratic(Env):
         # Randomize the goal we want to move to and the initial point.
         # We use `np_random` so that if the user passes `seed`, the
         # problem is completely deterministic.
-        self.goal = rng.uniform(space.low, space.high, size=space.shape)
-        self.position = rng.uniform(space.low, space.high, size=space.shape)
+        self.goal = rng.uniform(space.low[0], space.high[0])
+        self.position = rng.uniform(space.low[1], space.high[1])
 
         # `Env` expects us to return `obs` (with the shape and limits
         # given by `observation_space`) and a free-form *info* dict,
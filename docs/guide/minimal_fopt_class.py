@@ -44,12 +44,12 @@ class StraightLineSteering(coi.FunctionOptimizable):
             raise ValueError(f"cycle time out of bounds: {cycle_time!r}")
 
         # Initialize the disturbances here. We want the RNG to have been
-        # seeded already.
+        # seeded already. We draw all random numbers in one go instead
+        # of calling into the RNG once per disturbance.
         if not self.disturbances:
-            self.disturbances = {
-                self.np_random.integers(0, 1500): self.np_random.normal()
-                for _ in range(3)
-            }
+            times = self.np_random.integers(0, 1500, size=3)
+            values = self.np_random.standard_normal(size=3)
+            self.disturbances = dict(zip(times.tolist(), values.tolist()))
 
         return np.array(self.disturbances.get(int(cycle_time), 0.0))
 
@@ -36,24 +36,27 @@ with problem:
             optimizer = get_optimizer()
             space = problem.get_optimization_space(time)
             assert isinstance(space, Box)
+            low, high = space.low, space.high
             initial = params = problem.get_initial_params(time)
-            best = (float("inf"), initial)
+            best_loss, best_params = float("inf"), initial
             restore_on_failure.append((time, initial))
 
             while not optimizer.is_done():
-                # Update optimum.
+                # Update optimum. Copy the parameters in case the
+                # optimizer modifies them in place.
                 loss = problem.compute_function_objective(time, params)
-                best = min(best, (float(loss), params))
+                if loss < best_loss:
+                    best_loss, best_params = float(loss), params.copy()
 
                 # Fetch next set of parameters.
                 params = optimizer.step(loss)
-                params = clip(params, space.low, space.high)
+                params = clip(params, low, high)
 
             if optimizer.has_failed():
                 raise OptFailed(f"optimizer failed at t={time}")
             else:
                 # Restore best state.
-                problem.compute_function_objective(time, best[1])
+                problem.compute_function_objective(time, best_params)
     except:
         # If anything fails, restore initial state not only for the
         # current skeleton point, but all previous ones as well.
@@ -22,21 +22,24 @@ with problem:
     optimizer = get_optimizer()
     space = problem.optimization_space
     assert isinstance(space, Box)
+    low, high = space.low, space.high
     initial = params = problem.get_initial_params()
-    best = (float("inf"), initial)
+    best_loss, best_params = float("inf"), initial
 
     while not optimizer.is_done():
-        # Update optimum.
+        # Update optimum. Copy the parameters in case the optimizer
+        # modifies them in place.
         loss = problem.compute_single_objective(params)
-        best = min(best, (float(loss), params))
+        if loss < best_loss:
+            best_loss, best_params = float(loss), params.copy()
 
         # Fetch next set of parameters.
         params = optimizer.step(loss)
-        params = clip(params, space.low, space.high)
+        params = clip(params, low, high)
 
     if optimizer.has_failed():
         # Restore initial state.
         problem.compute_single_objective(initial)
     else:
         # Restore best state.
-        problem.compute_single_objective(best[1])
+        problem.compute_single_objective(best_params)
@@ -12,20 +12,24 @@
 
 from typing import Any
 
+import configurable  # type: ignore[import-not-found]  # noqa: F401
+import parabola  # type: ignore[import-not-found]  # noqa: F401
 from cernml import coi
 from cernml.coi import cancellation
 
-for plugin in ["configurable", "parabola"]:
-    __import__(plugin)
-
-if not coi.registry.all():
+specs = list(coi.registry.all())
+if not specs:
     raise AssertionError("no environments registered")
 
-for spec in coi.registry.all():
+for spec in specs:
     print("Checking", spec.id, "…")
     kwargs: dict[str, Any] = {}
     assert coi.is_problem_class(spec.entry_point), spec
     if spec.entry_point.metadata.get("cern.cancellable", False):
         kwargs["cancellation_token"] = cancellation.Token()
+    if spec.id == "ConfParabola-v0":
+        # Don't simulate machine latency; the checker calls the
+        # objective function many times.
+        kwargs["latency"] = 0.0
     env = coi.make(spec.id, **kwargs)
     coi.check(env, headless=True, warn=True)
@@ -10,6 +10,8 @@
 
 from __future__ import annotations
 
+import functools
+import math
 import sys
 import typing as t
 
@@ -21,6 +23,7 @@ from matplotlib.axes import Axes
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
 from numpy.typing import NDArray
 from PyQt5 import QtCore, QtGui, QtWidgets
 from typing_extensions import override
@@ -29,6 +32,30 @@ from cernml import coi
 from cernml.coi import cancellation
 
 
+def _l1_norm(vector: NDArray[np.double]) -> float:
+    """Fast path for the 1-norm of a vector."""
+    return float(np.abs(vector).sum())
+
+
+def _l2_norm(vector: NDArray[np.double]) -> float:
+    """Fast path for the Euclidean norm of a vector."""
+    return math.sqrt(vector @ vector)
+
+
+def _get_norm_func(norm: int) -> t.Callable[[NDArray[np.double]], t.SupportsFloat]:
+    """Return a function that calculates the vector norm of order *norm*.
+
+    On short vectors, `np.linalg.norm()` spends most of its time
+    parsing its arguments. We pick a specialized implementation once
+    instead of on every call.
+    """
+    if norm == 1:
+        return _l1_norm
+    if norm == 2:
+        return _l2_norm
+    return functools.partial(np.linalg.norm, ord=norm)
+
+
 class ConfParabola(
     coi.OptEnv[NDArray[np.double], NDArray[np.double], NDArray[np.double]],
     coi.Configurable,
@@ -36,6 +63,10 @@ class ConfParabola(
     """Example implementation of `OptEnv`.
 
     The goal of this environment is to find the center of a parabola.
+
+    The observations returned by `reset()` and `step()` are read-only
+    views of the current position. Copy them if you need to modify
+    them.
     """
 
     # pylint: disable = too-many-instance-attributes
@@ -62,6 +93,9 @@ class ConfParabola(
     action_space: gym.spaces.Box
     observation_space: gym.spaces.Box
     optimization_space: gym.spaces.Box
+    # Never modified in place, only replaced. This is what allows us to
+    # return it without copying it first.
+    pos: NDArray[np.double]
 
     def __init__(
         self,
@@ -71,17 +105,20 @@ class ConfParabola(
         dangling: bool = True,
         box_width: float = 2.0,
         dim: int = 5,
+        latency: float = 0.3,
         render_mode: str | None = None,
     ):
         self.render_mode = render_mode
         self.token = cancellation_token
+        # Seconds that each simulated machine interaction takes. Pass
+        # zero to skip the wait, e.g. in automated tests.
+        self.latency = latency
         self.norm = norm
+        self._norm_func = _get_norm_func(norm)
         self.dangling = dangling
-        self.action_space = gym.spaces.Box(-1.0, 1.0, shape=(dim,))
-        self.observation_space = gym.spaces.Box(-box_width, box_width, shape=(dim,))
-        self.optimization_space = gym.spaces.Box(-box_width, box_width, shape=(dim,))
-        self.pos: NDArray[np.double] = np.zeros((dim,))
+        self._make_spaces(box_width, dim)
         self.figure: Figure | None = None
+        self._pos_line: Line2D | None = None
 
     @override
     def get_config(self) -> coi.Config:
@@ -97,13 +134,12 @@ class ConfParabola(
     @override
     def apply_config(self, values: coi.ConfigValues) -> None:
         self.norm = values.norm
+        self._norm_func = _get_norm_func(values.norm)
         self.dangling = values.enable_dangling
-        box_width = values.box_width
-        dim = values.dimensions
-        self.observation_space = gym.spaces.Box(-box_width, box_width, shape=(dim,))
-        self.action_space = gym.spaces.Box(-1.0, 1.0, shape=(dim,))
-        self.optimization_space = gym.spaces.Box(-box_width, box_width, shape=(dim,))
-        self.pos = np.zeros((dim,))
+        self._make_spaces(values.box_width, values.dimensions)
+        # The bounds have changed, so replot everything on the next
+        # call to `render()`.
+        self._pos_line = None
 
     @override
     def reset(
@@ -115,25 +151,33 @@ class ConfParabola(
             self.action_space.seed(next_seed())
             self.observation_space.seed(next_seed())
             self.optimization_space.seed(next_seed())
-        self.pos = self.optimization_space.sample()
+        # Equivalent to `self.optimization_space.sample()`, which has
+        # the same bounds, but skips the generic sampling logic of `Box`.
+        # We keep the dtype of the space so that observations stay
+        # within the observation space.
+        self.pos = self.np_random.uniform(self._low, self._high).astype(self._low.dtype)
+        self.pos.setflags(write=False)
         # This is not good usage. In practice, you should only accept
         # and use cancellation tokens if your environment contains a
         # loop that waits for data. This is only for demonstration
         # purposes.
         self.token.raise_if_cancellation_requested()
-        return self.pos.copy(), {}
+        return self.pos, {}
 
     @override
     def step(
         self, action: NDArray[np.double]
     ) -> tuple[NDArray[np.double], float, bool, bool, coi.InfoDict]:
         old_pos = self.pos
-        next_pos = self.pos + action
-        self.pos = np.clip(
-            next_pos,
-            self.observation_space.low,
-            self.observation_space.high,
-        )
+        # Stay in the dtype of the observation space, even if the agent
+        # passes actions of a wider dtype.
+        next_pos = np.add(self.pos, action, dtype=self._low.dtype)
+        # Cheaper than `next_pos not in self.observation_space`, and
+        # unlike it, this doesn't reject positions of a wider dtype.
+        truncated = bool(((next_pos < self._low) | (next_pos > self._high)).any())
+        # We no longer need the unclipped position, so clip in place.
+        self.pos = np.clip(next_pos, self._low, self._high, out=next_pos)
+        self.pos.setflags(write=False)
         try:
             # Because cancellation is cooperative, we know this is the
             # only place where we can get cancelled.
@@ -143,29 +187,26 @@ class ConfParabola(
             self.token.complete_cancellation()
             raise
         terminated = reward > self.objective
-        truncated = next_pos not in self.observation_space
         info = {"objective": self.objective}
         if self.dangling and terminated and self.objective < self.max_objective:
             self.objective *= 0.95
         if self.render_mode == "human":
             self.render()
-        return self.pos.copy(), reward, terminated, truncated, info
+        return self.pos, reward, terminated, truncated, info
 
     @override
     def get_initial_params(
         self, *, seed: int | None = None, options: coi.InfoDict | None = None
     ) -> NDArray[np.double]:
         pos, _ = self.reset(seed=seed, options=options)
-        return pos
+        # Optimizers may want to update their parameters in place.
+        return pos.copy()
 
     @override
     def compute_single_objective(self, params: NDArray[np.double]) -> float:
         old_pos = self.pos
-        self.pos = np.clip(
-            params,
-            self.observation_space.low,
-            self.observation_space.high,
-        )
+        self.pos = np.clip(params, self._low, self._high)
+        self.pos.setflags(write=False)
         try:
             # Because cancellation is cooperative, we know this is the
             # only place where we can get cancelled.
@@ -185,35 +226,63 @@ class ConfParabola(
         if self.render_mode == "matplotlib_figures":
             if self.figure is None:
                 self.figure = Figure()
-                axes = self.figure.subplots()
-            else:
+                self.figure.subplots()
+            if self._pos_line is None:
                 [axes] = self.figure.axes
-            self._update_axes(axes)
+                self._pos_line = self._update_axes(axes)
+            else:
+                # Only the position has changed since the last call.
+                # Updating the existing line is much cheaper than
+                # clearing the axes and plotting everything anew.
+                self._pos_line.set_ydata(self.pos)
             return [self.figure]
         if self.render_mode == "ansi":
             return str(self.pos)
         return super().render()
 
-    def _update_axes(self, axes: Axes) -> None:
+    def _make_spaces(self, box_width: float, dim: int) -> None:
+        """Create all spaces and reset the position to the origin.
+
+        This is shared by `__init__()` and `apply_config()`. We also
+        cache the bounds of the observation space so that `step()` and
+        `compute_single_objective()` don't have to look them up on
+        every call.
+        """
+        self.action_space = gym.spaces.Box(-1.0, 1.0, shape=(dim,))
+        self.observation_space = gym.spaces.Box(-box_width, box_width, shape=(dim,))
+        self.optimization_space = gym.spaces.Box(-box_width, box_width, shape=(dim,))
+        self._low = self.observation_space.low
+        self._high = self.observation_space.high
+        self.pos = np.zeros((dim,), dtype=self._low.dtype)
+        self.pos.setflags(write=False)
+
+    def _update_axes(self, axes: Axes) -> Line2D:
         """Plot this environment onto the given axes.
 
         This method allows us to implement plotting once for both the
-        "human" and the "matplotlib_figures" render mode.
+        "human" and the "matplotlib_figures" render mode. It returns
+        the line that shows the current position so that the latter can
+        update it later.
         """
         axes.cla()
-        axes.plot(self.pos, "o")
+        [pos_line] = axes.plot(self.pos, "o")
         axes.plot(self.observation_space.low, "k--")
         axes.plot(self.observation_space.high, "k--")
         axes.plot(0.0 * self.observation_space.high, "k--")
         axes.set_xlabel("Axes")
         axes.set_ylabel("Position")
+        return pos_line
+
+    def _cancellation_requested(self) -> bool:
+        """Wait predicate for `_fetch_distance_slow()`."""
+        return self.token.cancellation_requested
 
     def _fetch_distance_slow(self, pos: np.ndarray | None = None) -> float:
         """Get distance from the goal in a slow manner.
 
-        This simulates interaction with the machine. We sleep for a
-        while, then return the distance between the current position and
-        the coordinate-space origin.
+        This simulates interaction with the machine. We sleep for
+        `latency` seconds, then return the distance between the current
+        position and the coordinate-space origin.
 
         Raises:
             cernml.cancellation.CancelledError: if a cancellation
@@ -221,51 +290,50 @@ class ConfParabola(
         """
         handle = self.token.wait_handle
         with handle:
-            if handle.wait_for(lambda: self.token.cancellation_requested, timeout=0.3):
+            if handle.wait_for(self._cancellation_requested, timeout=self.latency):
                 raise cancellation.CancelledError
-        return float(
-            np.linalg.norm(pos if pos is not None else self.pos, ord=self.norm)
-        )
+        return float(self._norm_func(pos if pos is not None else self.pos))
 
 
 coi.register("ConfParabola-v0", entry_point=ConfParabola, max_episode_steps=10)
 
 
 class OptimizerThread(QtCore.QThread):
-    """Qt Thread that runs a COBYLA optimization.
+    """Qt Thread that runs an SLSQP optimization.
 
     Args:
         env: An optimizable problem.
-    """
 
-    step = QtCore.pyqtSignal()
+    Attributes:
+        dirty: Set after each evaluation of the objective function. The
+            GUI thread polls and clears this flag to decide whether it
+            has to redraw its plots. Unlike a signal, this doesn't
+            queue one event per evaluation.
+    """
 
     def __init__(self, env: coi.SingleOptimizable) -> None:
         super().__init__()
         self.env = env
-        opt_space = env.optimization_space
-        assert isinstance(opt_space, gym.spaces.Box), opt_space
-        self.optimization_space = opt_space
+        self.dirty = False
 
     def run(self) -> None:
         """Thread main function."""
 
-        def constraint(params: NDArray[np.double]) -> t.SupportsFloat:
-            space = self.optimization_space
-            width = space.high - space.low
-            return np.linalg.norm(2 * params / width, ord=np.inf)
-
         def func(params: NDArray[np.double]) -> t.SupportsFloat:
             loss = self.env.compute_single_objective(params)
-            self.step.emit()
+            self.dirty = True
             return loss
 
+        # Look this up anew on each run. If the environment has been
+        # reconfigured in the meantime, it has a new space.
+        space = self.env.optimization_space
+        assert isinstance(space, gym.spaces.Box), space
         try:
             res: scipy.optimize.OptimizeResult = scipy.optimize.minimize(
                 func,
                 x0=self.env.get_initial_params(),
-                method="COBYLA",
-                constraints=[scipy.optimize.NonlinearConstraint(constraint, 0.0, 1.0)],
+                method="SLSQP",
+                bounds=scipy.optimize.Bounds(space.low, space.high),
                 tol=0.01,
             )
             if res.success:
@@ -291,9 +359,7 @@ class ConfigureDialog(QtWidgets.QDialog):
         self.setWindowTitle(f"Configure {name} ...")
         self.target = target
         self.config = self.target.get_config()
-        self.current_values = {
-            field.dest: field.value for field in self.config.fields()
-        }
+        self.current_values = self.config.get_field_values()
         main_layout = QtWidgets.QVBoxLayout()
         self.setLayout(main_layout)
         params = QtWidgets.QWidget()
@@ -413,8 +479,12 @@ class MainWindow(QtWidgets.QMainWindow):
         )
         self.env = t.cast(ConfParabola, env)
         self.worker = OptimizerThread(self.env)
-        self.worker.step.connect(self.on_opt_step)
         self.worker.finished.connect(self.on_opt_finished)
+        # Redraw at most 20 times per second, no matter how quickly the
+        # optimizer evaluates the objective function.
+        self.redraw_timer = QtCore.QTimer(self)
+        self.redraw_timer.setInterval(50)
+        self.redraw_timer.timeout.connect(self.on_opt_step)
         self.env.reset()
 
         [figure] = self.env.render()
@@ -460,6 +530,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.cancel.setEnabled(True)
         self.configure_env.setEnabled(False)
         self.worker.start()
+        self.redraw_timer.start()
 
     def on_cancel(self) -> None:
         """Send a cancellation request."""
@@ -469,12 +540,18 @@ class MainWindow(QtWidgets.QMainWindow):
         self.cancel.setEnabled(False)
 
     def on_opt_step(self) -> None:
-        """Update the plots."""
+        """Update the plots if the optimizer has made progress."""
+        if not self.worker.dirty:
+            return
+        self.worker.dirty = False
         self.env.render()
-        self.canvas.draw()
+        self.canvas.draw_idle()
 
     def on_opt_finished(self) -> None:
         """Re-enable the GUI."""
+        # Show the final state, even if it arrived after the last tick.
+        self.redraw_timer.stop()
+        self.on_opt_step()
         # Reset the cancellation, if it is possible. Only re-enable the
         # launch button if we could reset the cancellation (or no
         # cancellation ever occurred.)
@@ -19,6 +19,7 @@ import matplotlib.pyplot as plt
 import numpy as np
 import scipy.optimize
 from matplotlib.axes import Axes
+from matplotlib.collections import PathCollection
 from matplotlib.figure import Figure
 from numpy.typing import NDArray
 from stable_baselines3.common.base_class import BaseAlgorithm
@@ -32,6 +33,10 @@ class Parabola(coi.OptEnv):
     """Example implementation of `OptEnv`.
 
     The goal of this environment is to find the center of a 2D parabola.
+
+    The observations returned by `reset()` and `step()` are read-only
+    views of the current position. Copy them if you need to modify
+    them.
     """
 
     # Domain declarations.
@@ -66,9 +71,18 @@ class Parabola(coi.OptEnv):
 
     def __init__(self, *, render_mode: str | None = None) -> None:
         self.render_mode = render_mode
+        # Never modified in place, only replaced. This is what allows us
+        # to return it without copying it first.
         self.pos: NDArray[np.double] = np.zeros(2)
+        self.pos.setflags(write=False)
+        # Cache the bounds so that `step()` and
+        # `compute_single_objective()` don't have to look them up on
+        # every call.
+        self._low = self.observation_space.low
+        self._high = self.observation_space.high
         self._train = True
         self.figure: Figure | None = None
+        self._trail: PathCollection | None = None
 
     def train(self, train: bool = True) -> None:
         """Turn the environment's training mode on or off.
@@ -89,43 +103,46 @@ class Parabola(coi.OptEnv):
             self.action_space.seed(next_seed())
             self.observation_space.seed(next_seed())
             self.optimization_space.seed(next_seed())
-        # Don't use the full observation space for initial states.
-        self.pos = self.action_space.sample()
-        return self.pos.copy(), {}
+        # Don't use the full observation space for initial states. This
+        # is equivalent to `self.action_space.sample()`, but skips the
+        # generic sampling logic of `Box`. We keep the dtype of the
+        # space so that observations stay within the observation space.
+        low, high = self.action_space.low, self.action_space.high
+        self.pos = self.np_random.uniform(low, high).astype(low.dtype)
+        self.pos.setflags(write=False)
+        return self.pos, {}
 
     @override
     def step(
         self, action: NDArray[np.double]
     ) -> tuple[NDArray[np.double], float, bool, bool, coi.InfoDict]:
         next_pos = self.pos + action
-        self.pos = np.clip(
-            next_pos,
-            self.observation_space.low,
-            self.observation_space.high,
-        )
-        reward = -sum(self.pos**2)
+        # Cheaper than `next_pos not in self.observation_space`, and
+        # unlike it, this doesn't reject positions of a wider dtype.
+        truncated = bool(((next_pos < self._low) | (next_pos > self._high)).any())
+        # We no longer need the unclipped position, so clip in place.
+        self.pos = np.clip(next_pos, self._low, self._high, out=next_pos)
+        self.pos.setflags(write=False)
+        reward = -float(self.pos @ self.pos)
         terminated = reward > self.objective
-        truncated = next_pos not in self.observation_space
         info = {"objective": self.objective}
         if self._train and terminated and self.objective < self.max_objective:
             self.objective *= 0.95
-        return self.pos.copy(), reward, terminated, truncated, info
+        return self.pos, reward, terminated, truncated, info
 
     @override
     def get_initial_params(
         self, *, seed: int | None = None, options: coi.InfoDict | None = None
     ) -> NDArray[np.double]:
         pos, _ = self.reset(seed=seed, options=options)
-        return pos
+        # Optimizers may want to update their parameters in place.
+        return pos.copy()
 
     @override
     def compute_single_objective(self, params: NDArray[np.double]) -> float:
-        self.pos = np.clip(
-            params,
-            self.observation_space.low,
-            self.observation_space.high,
-        )
-        return sum(self.pos**2)
+        self.pos = np.clip(params, self._low, self._high)
+        self.pos.setflags(write=False)
+        return float(self.pos @ self.pos)
 
     @override
     def render(self) -> t.Any:
@@ -135,12 +152,18 @@ class Parabola(coi.OptEnv):
             plt.show()
             return None
         if self.render_mode == "matplotlib_figures":
-            if self.figure is None:
+            if self._trail is None:
                 self.figure = Figure()
                 axes = t.cast(Axes, self.figure.subplots())
-            else:
-                [axes] = self.figure.axes
-            axes.scatter(*self.pos)
+                # Positions never leave the observation space, so we
+                # needn't rescale the axes as the points pile up.
+                axes.set_xlim(self._low[0], self._high[0])
+                axes.set_ylim(self._low[1], self._high[1])
+                self._trail = axes.scatter([], [])
+            # Add the current position to those visited so far. A single
+            # collection is much cheaper to draw than one per call.
+            visited = self._trail.get_offsets()
+            self._trail.set_offsets(np.concatenate([visited, [self.pos]]))
             return [self.figure]
         if self.render_mode == "ansi":
             return str(self.pos)
@@ -186,14 +209,17 @@ def main_rl(env: Parabola, num_runs: int) -> list[bool]:
 
 def main_opt(env: Parabola, num_runs: int) -> list[bool]:
     """Handler for `opt` mode."""
-    bounds = bounds = scipy.optimize.Bounds(
+    bounds = scipy.optimize.Bounds(
         env.optimization_space.low,
         env.optimization_space.high,
     )
+    # We treat the objective as a black box and let the optimizer
+    # estimate gradients. A real machine wouldn't give us any either.
     return [
         scipy.optimize.minimize(
             fun=env.compute_single_objective,
             x0=env.get_initial_params(),
+            method="L-BFGS-B",
             bounds=bounds,
         ).success
         for _ in range(num_runs)
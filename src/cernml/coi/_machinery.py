@@ -402,12 +402,14 @@ def find_mismatched_attr(proto: AttrCheckProtocolMeta, obj: object) -> t.Optiona
     function manually to find the name of the offending protocol member.
     """
     getattr_static = lazy_load_getattr_static()
+    # Look these up once instead of once per protocol member.
+    classmethods = proto_classmethods(proto)
+    non_callables = non_callable_proto_members(proto)
+    cls_or_obj = obj if isinstance(obj, type) else type(obj)
     for attr in protocol_attrs(proto):
-        is_classmethod = attr in proto_classmethods(proto)
+        is_classmethod = attr in classmethods
         try:
-            val = getattr_static(
-                type(obj) if is_classmethod and not isinstance(obj, type) else obj, attr
-            )
+            val = getattr_static(cls_or_obj if is_classmethod else obj, attr)
         except AttributeError:
             if not (is_protocol(obj) and attr_in_annotations(obj, attr)):
                 return attr
@@ -415,7 +417,7 @@ def find_mismatched_attr(proto: AttrCheckProtocolMeta, obj: object) -> t.Optiona
             if is_classmethod:
                 if not isinstance(val, classmethod):
                     return attr
-            elif val is None and attr not in non_callable_proto_members(proto):
+            elif val is None and attr not in non_callables:
                 return attr
     return None
 
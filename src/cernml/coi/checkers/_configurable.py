@@ -6,16 +6,20 @@
 
 """Checker for the `Configurable` ABC."""
 
+# pylint: disable = import-outside-toplevel
+
 import os
 import typing as t
 import warnings
-from unittest.mock import Mock, PropertyMock
 
 import numpy as np
 
 from ..configurable import Config, Configurable
 from ._generic import bump_warn_arg
 
+if t.TYPE_CHECKING:
+    from unittest.mock import Mock, PropertyMock
+
 
 def check_configurable(problem: Configurable, warn: int = True) -> None:
     """Check the run-time invariants of the given interface."""
@@ -119,7 +123,7 @@ def assert_handles_values(
         # because this is a mock, type(values) != values.__class__.
         property_mocks = vars(values.__class__)
         for field in config.fields():
-            prop: PropertyMock = property_mocks[field.dest]
+            prop: "PropertyMock" = property_mocks[field.dest]
             if not prop.call_count:
                 warnings.warn(
                     f"configured value for field {field.dest!r} has "
@@ -128,7 +132,7 @@ def assert_handles_values(
                 )
 
 
-def make_mock_values(config: Config) -> Mock:
+def make_mock_values(config: Config) -> "Mock":
     """Create a mock of the validated config values.
 
     Example:
@@ -165,6 +169,10 @@ def make_mock_values(config: Config) -> Mock:
         ...
         AttributeError: Mock object has no attribute 'baz'
     """
+    # Delay loading `unittest.mock` until it's needed. See
+    # `assert_human_render_called()` for why.
+    from unittest.mock import Mock, PropertyMock
+
     strings = {f.dest: get_round_tripping_string_repr(f.value) for f in config.fields()}
     values = config.validate_all(strings)
 
@@ -6,8 +6,9 @@
 
 """Generic assertions and checks used by multiple checkers."""
 
+# pylint: disable = import-outside-toplevel
+
 import typing as t
-import unittest.mock
 from contextlib import contextmanager
 
 import gymnasium as gym
@@ -95,6 +96,11 @@ def assert_human_render_called(problem: "protocols.Problem") -> t.Iterator[None]
     if mode != "human":
         yield
         return
+    # Delay loading `unittest.mock` until it's needed. It pulls in
+    # `asyncio` and `unittest`, which would otherwise make importing
+    # this package noticeably slower.
+    import unittest.mock
+
     render = problem.render
     mock = unittest.mock.Mock(name=str(render), wraps=render)
     with unittest.mock.patch.object(problem, "render", new_callable=lambda: mock):